@@ -15,96 +15,67 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import your modules
 from data_handler.data_handler import load_data
-from strategies.moving_average import sma_crossover
-from backtester.backtester import backtest
+from backtester.backtester import sma_backtest
+from backtester.metrics import MetricsContext, calculate_cagr, calculate_sharpe
+from backtester.sweep import sweep_sma
 
 
-def calculate_cagr(equity_series):
-    """Calculate Compound Annual Growth Rate"""
-    if len(equity_series) < 2:
-        return 0
-    
-    initial_value = equity_series.iloc[0]
-    final_value = equity_series.iloc[-1]
-    
-    # Calculate years (assuming daily data)
-    n_days = len(equity_series)
-    n_years = n_days / 252  # Trading days per year
-    
-    if n_years == 0 or initial_value == 0:
-        return 0
-    
-    cagr = ((final_value / initial_value) ** (1 / n_years) - 1) * 100
-    return cagr
-
-
-def calculate_sharpe(returns, risk_free_rate=0.02):
-    """Calculate Sharpe Ratio"""
-    # Clean returns (remove NaN and inf)
-    returns_clean = returns.dropna()
-    
-    if len(returns_clean) == 0:
-        return 0
-    
-    # Annual Sharpe ratio (assuming 252 trading days)
-    mean_return = returns_clean.mean() * 252
-    std_return = returns_clean.std() * np.sqrt(252)
-    
-    if std_return == 0:
-        return 0
-    
-    sharpe = (mean_return - risk_free_rate) / std_return
-    return sharpe
-
-
-def calculate_additional_metrics(df_with_signals):
-    """Calculate additional performance metrics"""
-    returns = df_with_signals['Strategy_Return'].dropna()
-    equity = df_with_signals['Equity']
+def calculate_additional_metrics(ctx):
+    """Calculate additional performance metrics from a MetricsContext"""
+    r = ctx.r
     
     metrics = {}
     
+    # Build the win/loss masks once and derive everything from them
+    pos = r > 0
+    neg = r < 0
+    n_wins = pos.sum()
+    n_losses = neg.sum()
+    wins = r[pos]
+    losses = r[neg]
+    
     # Win rate
-    winning_trades = (returns > 0).sum()
-    total_trades = len(returns[returns != 0])
-    metrics['Win Rate'] = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+    total_trades = n_wins + n_losses
+    metrics['Win Rate'] = (n_wins / total_trades * 100) if total_trades > 0 else 0
     
     # Average win/loss
-    wins = returns[returns > 0]
-    losses = returns[returns < 0]
-    metrics['Avg Win'] = wins.mean() * 100 if len(wins) > 0 else 0
-    metrics['Avg Loss'] = losses.mean() * 100 if len(losses) > 0 else 0
+    metrics['Avg Win'] = wins.mean() * 100 if n_wins > 0 else 0
+    metrics['Avg Loss'] = losses.mean() * 100 if n_losses > 0 else 0
     
     # Profit factor
     total_wins = wins.sum()
-    total_losses = abs(losses.sum())
+    total_losses = -losses.sum()
     metrics['Profit Factor'] = total_wins / total_losses if total_losses > 0 else float('inf')
     
     # Volatility (annualized)
-    metrics['Volatility'] = returns.std() * np.sqrt(252) * 100
+    metrics['Volatility'] = ctx.std * np.sqrt(252) * 100
     
     return metrics
 
 
 def create_equity_curve_plot(df_with_signals, ticker):
     """Create interactive equity curve plot"""
+    dates = df_with_signals['Date'].to_numpy()
+    close = df_with_signals['Close'].to_numpy()
+    equity = df_with_signals['Equity'].to_numpy()
+    
     fig = go.Figure()
     
     # Equity curve
     fig.add_trace(go.Scatter(
-        x=df_with_signals['Date'],
-        y=df_with_signals['Equity'],
+        x=dates,
+        y=equity,
         mode='lines',
         name='Strategy Equity',
         line=dict(color='#1f77b4', width=2)
     ))
     
     # Buy and Hold comparison
-    initial_capital = df_with_signals['Equity'].iloc[0]
-    buy_hold = (df_with_signals['Close'] / df_with_signals['Close'].iloc[0]) * initial_capital
+    initial_capital = equity[0]
+    buy_hold = close * (initial_capital / close[0])
     
     fig.add_trace(go.Scatter(
-        x=df_with_signals['Date'],
+        x=dates,
         y=buy_hold,
         mode='lines',
         name='Buy & Hold',
@@ -123,8 +94,26 @@ def create_equity_curve_plot(df_with_signals, ticker):
     return fig
 
 
+def _get_signal_array(df):
+    """Normalize the available signal column(s) to int8: 1=buy, -1=sell, 0=none"""
+    # Check columns in priority order: Position, Signal, Buy_Signal/Sell_Signal
+    for col in ('Position', 'Signal'):
+        if col in df.columns:
+            values = df[col].to_numpy()
+            return np.select([values == 1, values == -1], [1, -1], 0).astype(np.int8)
+    sig = np.zeros(len(df), dtype=np.int8)
+    if 'Sell_Signal' in df.columns:
+        sig[df['Sell_Signal'].to_numpy() == 1] = -1
+    if 'Buy_Signal' in df.columns:
+        sig[df['Buy_Signal'].to_numpy() == 1] = 1
+    return sig
+
+
 def create_price_signals_plot(df_with_signals, ticker, short_window, long_window):
     """Create price chart with signals"""
+    dates = df_with_signals['Date'].to_numpy()
+    close = df_with_signals['Close'].to_numpy()
+    
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
@@ -135,82 +124,58 @@ def create_price_signals_plot(df_with_signals, ticker, short_window, long_window
     
     # Price and moving averages
     fig.add_trace(go.Scatter(
-        x=df_with_signals['Date'],
-        y=df_with_signals['Close'],
+        x=dates,
+        y=close,
         mode='lines',
         name='Price',
         line=dict(color='black', width=1)
     ), row=1, col=1)
     
     fig.add_trace(go.Scatter(
-        x=df_with_signals['Date'],
-        y=df_with_signals[f'SMA_{short_window}'],
+        x=dates,
+        y=df_with_signals['SMA_short'].to_numpy(),
         mode='lines',
         name=f'SMA {short_window}',
         line=dict(color='blue', width=1)
     ), row=1, col=1)
     
     fig.add_trace(go.Scatter(
-        x=df_with_signals['Date'],
-        y=df_with_signals[f'SMA_{long_window}'],
+        x=dates,
+        y=df_with_signals['SMA_long'].to_numpy(),
         mode='lines',
         name=f'SMA {long_window}',
         line=dict(color='red', width=1)
     ), row=1, col=1)
     
-    # Buy signals - check for Position column or signal columns
-    buy_condition = None
-    if 'Position' in df_with_signals.columns:
-        buy_signals = df_with_signals[df_with_signals['Position'] == 1]
-        buy_condition = 'Position'
-    elif 'Signal' in df_with_signals.columns:
-        buy_signals = df_with_signals[df_with_signals['Signal'] == 1]
-        buy_condition = 'Signal'
-    elif 'Buy_Signal' in df_with_signals.columns:
-        buy_signals = df_with_signals[df_with_signals['Buy_Signal'] == 1]
-        buy_condition = 'Buy_Signal'
-    else:
-        buy_signals = pd.DataFrame()  # Empty dataframe if no signal column found
-    
-    if not buy_signals.empty:
+    # Buy/sell markers from a single normalized signal array
+    sig = _get_signal_array(df_with_signals)
+    # Mark only the bars where the signal switches, not every bar it is held
+    trans = np.diff(sig, prepend=0)
+    buy_mask = (trans > 0) & (sig == 1)
+    sell_mask = (trans < 0) & (sig == -1)
+    
+    if buy_mask.any():
         fig.add_trace(go.Scatter(
-            x=buy_signals['Date'],
-            y=buy_signals['Close'],
+            x=dates[buy_mask],
+            y=close[buy_mask],
             mode='markers',
             name='Buy Signal',
             marker=dict(symbol='triangle-up', size=10, color='green')
         ), row=1, col=1)
     
-    # Sell signals
-    sell_condition = None
-    if 'Position' in df_with_signals.columns:
-        sell_signals = df_with_signals[df_with_signals['Position'] == -1]
-        sell_condition = 'Position'
-    elif 'Signal' in df_with_signals.columns:
-        sell_signals = df_with_signals[df_with_signals['Signal'] == -1]
-        sell_condition = 'Signal'
-    elif 'Sell_Signal' in df_with_signals.columns:
-        sell_signals = df_with_signals[df_with_signals['Sell_Signal'] == 1]
-        sell_condition = 'Sell_Signal'
-    else:
-        sell_signals = pd.DataFrame()  # Empty dataframe if no signal column found
-    
-    if not sell_signals.empty:
+    if sell_mask.any():
         fig.add_trace(go.Scatter(
-            x=sell_signals['Date'],
-            y=sell_signals['Close'],
+            x=dates[sell_mask],
+            y=close[sell_mask],
             mode='markers',
             name='Sell Signal',
             marker=dict(symbol='triangle-down', size=10, color='red')
         ), row=1, col=1)
     
-    print(f"[Debug] Buy condition column: {buy_condition}, Sell condition column: {sell_condition}")
-    print(f"[Debug] Buy signals found: {len(buy_signals)}, Sell signals found: {len(sell_signals)}")
-    
     # Volume
     fig.add_trace(go.Bar(
-        x=df_with_signals['Date'],
-        y=df_with_signals['Volume'],
+        x=dates,
+        y=df_with_signals['Volume'].to_numpy(),
         name='Volume',
         marker_color='lightblue',
         showlegend=False
@@ -253,34 +218,140 @@ def create_returns_distribution_plot(df_with_signals):
     return fig
 
 
+class _NoDataError(Exception):
+    """Empty load; raised so st.cache_data doesn't keep a failed fetch"""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_load(ticker, start, end, interval):
+    """Memoized load_data so reruns with the same inputs skip the fetch"""
+    df = load_data(ticker, start, end, interval)
+    if df.empty:
+        raise _NoDataError(ticker)
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_backtest(ticker, start, end, short_window, long_window, initial_capital):
+    """Memoized backtest keyed on the data request and strategy parameters"""
+    df = _cached_load(ticker, start, end, "1d")
+    return sma_backtest(
+        df,
+        initial_capital=initial_capital,
+        short_window=short_window,
+        long_window=long_window,
+    )
+
+
 def run_backtest_ui(ticker, start_date, end_date, short_window, long_window, initial_capital):
     """Run backtest and return results"""
     try:
+        start = start_date.strftime('%Y-%m-%d')
+        end = end_date.strftime('%Y-%m-%d')
+
         # Load data
         with st.spinner(f'Loading data for {ticker}...'):
-            df = load_data(ticker, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), "1d")
-        
-        if df.empty:
-            st.error(f"No data available for {ticker} in the specified date range.")
-            return None, None
+            _cached_load(ticker, start, end, "1d")
         
         # Run backtest
         with st.spinner('Running backtest...'):
-            results, df_with_signals = backtest(
-                df,
-                sma_crossover,
-                initial_capital=initial_capital,
-                short_window=short_window,
-                long_window=long_window,
+            results, df_with_signals = _cached_backtest(
+                ticker, start, end, short_window, long_window, initial_capital
             )
         
         return results, df_with_signals
     
+    except _NoDataError:
+        st.error(f"No data available for {ticker} in the specified date range.")
+        return None, None
     except Exception as e:
         st.error(f"Error running backtest: {str(e)}")
         return None, None
 
 
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_figures(ticker, start, end, short_window, long_window, initial_capital):
+    """Build the chart figures once per backtest configuration"""
+    _, df_with_signals = _cached_backtest(ticker, start, end, short_window, long_window, initial_capital)
+    return (
+        create_equity_curve_plot(df_with_signals, ticker),
+        create_price_signals_plot(df_with_signals, ticker, short_window, long_window),
+        create_returns_distribution_plot(df_with_signals),
+    )
+
+
+def create_sweep_heatmap(grid_df, metric):
+    """Create heatmap of a grid search metric over (short, long) windows"""
+    table = grid_df.pivot(index='Short', columns='Long', values=metric)
+    
+    fig = px.imshow(
+        table,
+        labels=dict(x='Long SMA Window', y='Short SMA Window', color=metric),
+        color_continuous_scale='RdYlGn',
+        aspect='auto',
+        origin='lower'
+    )
+    
+    fig.update_layout(
+        title=f'Grid Search - {metric}',
+        height=500
+    )
+    
+    return fig
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_sweep(ticker, start, end, short_windows, long_windows, initial_capital):
+    """Memoized parameter sweep keyed on the data request and window grid"""
+    df = _cached_load(ticker, start, end, "1d")
+    return sweep_sma(df, short_windows, long_windows, initial_capital=initial_capital)
+
+
+def run_grid_search_ui(ticker, start_date, end_date, initial_capital):
+    """Grid search SMA windows and render the results heatmap"""
+    col1, col2 = st.columns(2)
+    with col1:
+        short_range = st.slider("Short SMA Range", min_value=5, max_value=100, value=(10, 50), step=5)
+    with col2:
+        long_range = st.slider("Long SMA Range", min_value=50, max_value=300, value=(100, 250), step=10)
+    
+    metric = st.selectbox("Metric", ["Sharpe", "Final_Capital", "Max_Drawdown_%"])
+    
+    if not st.button("🔍 Run Grid Search", type="primary"):
+        return
+    
+    start = start_date.strftime('%Y-%m-%d')
+    end = end_date.strftime('%Y-%m-%d')
+    short_windows = tuple(range(short_range[0], short_range[1] + 1, 5))
+    long_windows = tuple(range(long_range[0], long_range[1] + 1, 10))
+    
+    try:
+        with st.spinner(f'Loading data for {ticker}...'):
+            _cached_load(ticker, start, end, "1d")
+        
+        with st.spinner('Running grid search...'):
+            grid_df = _cached_sweep(ticker, start, end, short_windows, long_windows, initial_capital)
+    
+    except _NoDataError:
+        st.error(f"No data available for {ticker} in the specified date range.")
+        return
+    except Exception as e:
+        st.error(f"Error running grid search: {str(e)}")
+        return
+    
+    if grid_df.empty:
+        st.error("No window pairs with short < long in the selected ranges.")
+        return
+    
+    st.plotly_chart(create_sweep_heatmap(grid_df, metric), use_container_width=True)
+    
+    best = grid_df.loc[grid_df[metric].idxmax()]
+    st.success(f"Best {metric}: {best[metric]:.2f} (Short {int(best['Short'])}, Long {int(best['Long'])})")
+    
+    with st.expander("📋 View Grid Results", expanded=False):
+        st.dataframe(grid_df, use_container_width=True)
+
+
 def main():
     st.set_page_config(
         page_title="Algo Trading Simulator",
@@ -321,137 +392,149 @@ def main():
         # Run backtest button
         run_button = st.button("🚀 Run Backtest", type="primary", use_container_width=True)
     
-    # Main content area
-    if run_button and short_window < long_window:
-        results, df_with_signals = run_backtest_ui(ticker, start_date, end_date, short_window, long_window, initial_capital)
+    tab_backtest, tab_grid = st.tabs(["📊 Backtest", "🔍 Grid Search"])
+
+    with tab_backtest:
+        # Main content area
+        if run_button and short_window < long_window:
+            results, df_with_signals = run_backtest_ui(ticker, start_date, end_date, short_window, long_window, initial_capital)
         
-        if results is not None and df_with_signals is not None:
-            # Calculate additional metrics
-            cagr = calculate_cagr(df_with_signals['Equity'])
-            sharpe = calculate_sharpe(df_with_signals['Strategy_Return'])
-            additional_metrics = calculate_additional_metrics(df_with_signals)
+            if results is not None and df_with_signals is not None:
+                # Calculate additional metrics (cleaned arrays are shared via one context)
+                ctx = MetricsContext(df_with_signals['Equity'], df_with_signals['Strategy_Return'])
+                cagr = calculate_cagr(ctx.eq)
+                sharpe = calculate_sharpe(ctx)
+                additional_metrics = calculate_additional_metrics(ctx)
             
-            # Display key metrics
-            st.header("📊 Performance Summary")
+                # Display key metrics
+                st.header("📊 Performance Summary")
             
-            col1, col2, col3, col4 = st.columns(4)
+                col1, col2, col3, col4 = st.columns(4)
             
-            with col1:
-                st.metric(
-                    "Total Return",
-                    f"{results['Total_Return_%']:.2f}%",
-                    delta=f"{results['Total_Return_%']:.2f}%"
-                )
+                with col1:
+                    st.metric(
+                        "Total Return",
+                        f"{results['Total_Return_%']:.2f}%",
+                        delta=f"{results['Total_Return_%']:.2f}%"
+                    )
             
-            with col2:
-                st.metric(
-                    "CAGR",
-                    f"{cagr:.2f}%",
-                    delta=f"{cagr:.2f}%"
-                )
+                with col2:
+                    st.metric(
+                        "CAGR",
+                        f"{cagr:.2f}%",
+                        delta=f"{cagr:.2f}%"
+                    )
             
-            with col3:
-                st.metric(
-                    "Sharpe Ratio",
-                    f"{sharpe:.2f}",
-                    delta=f"{sharpe:.2f}"
-                )
+                with col3:
+                    st.metric(
+                        "Sharpe Ratio",
+                        f"{sharpe:.2f}",
+                        delta=f"{sharpe:.2f}"
+                    )
             
-            with col4:
-                st.metric(
-                    "Max Drawdown",
-                    f"{results['Max_Drawdown_%']:.2f}%",
-                    delta=f"-{results['Max_Drawdown_%']:.2f}%"
-                )
+                with col4:
+                    st.metric(
+                        "Max Drawdown",
+                        f"{results['Max_Drawdown_%']:.2f}%",
+                        delta=f"-{results['Max_Drawdown_%']:.2f}%"
+                    )
             
-            # Detailed metrics table
-            st.subheader("📈 Detailed Metrics")
+                # Detailed metrics table
+                st.subheader("📈 Detailed Metrics")
             
-            col1, col2 = st.columns(2)
+                col1, col2 = st.columns(2)
             
-            with col1:
-                metrics_data = {
-                    "Metric": [
-                        "Initial Capital",
-                        "Final Capital",
-                        "Total Return",
-                        "CAGR",
-                        "Sharpe Ratio",
-                        "Max Drawdown"
-                    ],
-                    "Value": [
-                        f"${initial_capital:,.2f}",
-                        f"${results['Final_Capital']:,.2f}",
-                        f"{results['Total_Return_%']:.2f}%",
-                        f"{cagr:.2f}%",
-                        f"{sharpe:.2f}",
-                        f"{results['Max_Drawdown_%']:.2f}%"
-                    ]
-                }
-                st.dataframe(pd.DataFrame(metrics_data), use_container_width=True)
+                with col1:
+                    metrics_data = {
+                        "Metric": [
+                            "Initial Capital",
+                            "Final Capital",
+                            "Total Return",
+                            "CAGR",
+                            "Sharpe Ratio",
+                            "Max Drawdown"
+                        ],
+                        "Value": [
+                            f"${initial_capital:,.2f}",
+                            f"${results['Final_Capital']:,.2f}",
+                            f"{results['Total_Return_%']:.2f}%",
+                            f"{cagr:.2f}%",
+                            f"{sharpe:.2f}",
+                            f"{results['Max_Drawdown_%']:.2f}%"
+                        ]
+                    }
+                    st.dataframe(pd.DataFrame(metrics_data), use_container_width=True)
             
-            with col2:
-                additional_data = {
-                    "Metric": [
-                        "Win Rate",
-                        "Average Win",
-                        "Average Loss",
-                        "Profit Factor",
-                        "Volatility (Annual)"
-                    ],
-                    "Value": [
-                        f"{additional_metrics['Win Rate']:.2f}%",
-                        f"{additional_metrics['Avg Win']:.2f}%",
-                        f"{additional_metrics['Avg Loss']:.2f}%",
-                        f"{additional_metrics['Profit Factor']:.2f}",
-                        f"{additional_metrics['Volatility']:.2f}%"
-                    ]
-                }
-                st.dataframe(pd.DataFrame(additional_data), use_container_width=True)
+                with col2:
+                    additional_data = {
+                        "Metric": [
+                            "Win Rate",
+                            "Average Win",
+                            "Average Loss",
+                            "Profit Factor",
+                            "Volatility (Annual)"
+                        ],
+                        "Value": [
+                            f"{additional_metrics['Win Rate']:.2f}%",
+                            f"{additional_metrics['Avg Win']:.2f}%",
+                            f"{additional_metrics['Avg Loss']:.2f}%",
+                            f"{additional_metrics['Profit Factor']:.2f}",
+                            f"{additional_metrics['Volatility']:.2f}%"
+                        ]
+                    }
+                    st.dataframe(pd.DataFrame(additional_data), use_container_width=True)
             
-            # Charts
-            st.header("📊 Charts")
+                # Charts (figures are cached per backtest configuration)
+                st.header("📊 Charts")
+                equity_fig, signals_fig, returns_fig = _cached_figures(
+                    ticker,
+                    start_date.strftime('%Y-%m-%d'),
+                    end_date.strftime('%Y-%m-%d'),
+                    short_window,
+                    long_window,
+                    initial_capital,
+                )
             
-            # Equity curve
-            st.subheader("Equity Curve")
-            equity_fig = create_equity_curve_plot(df_with_signals, ticker)
-            st.plotly_chart(equity_fig, use_container_width=True)
+                # Equity curve
+                st.subheader("Equity Curve")
+                st.plotly_chart(equity_fig, use_container_width=True)
             
-            # Price and signals
-            st.subheader("Price Chart with Signals")
-            signals_fig = create_price_signals_plot(df_with_signals, ticker, short_window, long_window)
-            st.plotly_chart(signals_fig, use_container_width=True)
+                # Price and signals
+                st.subheader("Price Chart with Signals")
+                st.plotly_chart(signals_fig, use_container_width=True)
             
-            # Returns distribution
-            st.subheader("Returns Distribution")
-            returns_fig = create_returns_distribution_plot(df_with_signals)
-            st.plotly_chart(returns_fig, use_container_width=True)
+                # Returns distribution
+                st.subheader("Returns Distribution")
+                st.plotly_chart(returns_fig, use_container_width=True)
             
-            # Data table
-            with st.expander("📋 View Raw Data", expanded=False):
-                st.dataframe(df_with_signals.tail(100), use_container_width=True)
-    
-    elif not run_button:
-        # Instructions
-        st.info("""
-        ### Welcome to the Algorithmic Trading Simulator! 
+                # Data table
+                with st.expander("📋 View Raw Data", expanded=False):
+                    st.dataframe(df_with_signals.tail(100), use_container_width=True)
+    
+        elif not run_button:
+            # Instructions
+            st.info("""
+            ### Welcome to the Algorithmic Trading Simulator! 
         
-        This tool allows you to backtest a Simple Moving Average (SMA) crossover strategy on any stock.
+            This tool allows you to backtest a Simple Moving Average (SMA) crossover strategy on any stock.
         
-        **How to use:**
-        1. 📝 Enter a stock ticker symbol (e.g., AAPL, MSFT, GOOGL)
-        2. 📅 Select your backtest date range
-        3. ⚙️ Adjust the SMA windows (short must be < long)
-        4. 💰 Set your initial capital
-        5. 🚀 Click "Run Backtest" to see results
+            **How to use:**
+            1. 📝 Enter a stock ticker symbol (e.g., AAPL, MSFT, GOOGL)
+            2. 📅 Select your backtest date range
+            3. ⚙️ Adjust the SMA windows (short must be < long)
+            4. 💰 Set your initial capital
+            5. 🚀 Click "Run Backtest" to see results
         
-        **Strategy Explanation:**
-        - **Buy Signal**: When short SMA crosses above long SMA
-        - **Sell Signal**: When short SMA crosses below long SMA
-        - The strategy alternates between being long the stock and holding cash
+            **Strategy Explanation:**
+            - **Buy Signal**: When short SMA crosses above long SMA
+            - **Sell Signal**: When short SMA crosses below long SMA
+            - The strategy alternates between being long the stock and holding cash
         
-        Select your parameters in the sidebar and click "Run Backtest" to get started!
-        """)
+            Select your parameters in the sidebar and click "Run Backtest" to get started!
+            """)
+
+    with tab_grid:
+        run_grid_search_ui(ticker, start_date, end_date, initial_capital)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 #init
-from .backtester import backtest, max_drawdown
+from .backtester import backtest, max_drawdown, sma_backtest
+from .sweep import sweep_sma
 from .metrics import (
     calculate_cagr,
     calculate_sharpe,
     calculate_max_drawdown,
     calculate_sortino,
     calculate_calmar,
-    calculate_win_rate
+    calculate_win_rate,
+    MetricsContext
 )
\ No newline at end of file
@@ -0,0 +1,39 @@
+# backtester/_aot.py
+"""
+Ahead-of-time build of the backtest kernels.
+
+Run ``python -m backtester._aot`` once after installing to produce the
+``backtester_aot`` extension next to this file; backtester.kernels picks it
+up on import so the app never pays the Numba JIT cost on first use.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .kernels import _JIT_KERNELS, SOURCE_HASH
+
+SIGNATURES = {
+    'max_drawdown_kernel': 'f8(f8[:])',
+    'backtest_kernel': 'Tuple((f8[:], f8[:], f8[:], f8[:], f8))(f8[:], f8[:], f8)',
+    'run_sma_backtest': (
+        'Tuple((f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8, f8, f8, i8))'
+        '(f8[:], f8[:], i8, i8, f8)'
+    ),
+}
+
+cc = CC('backtester_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for kernel in _JIT_KERNELS:
+    cc.export(kernel.__name__, SIGNATURES[kernel.__name__])(kernel.py_func)
+
+
+# Checked by backtester.kernels on import so a build of older source isn't used
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+
+if __name__ == '__main__':
+    cc.compile()
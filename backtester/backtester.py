@@ -1,28 +1,68 @@
+import numpy as np
 import pandas as pd
 
+from .kernels import backtest_kernel, max_drawdown_kernel, run_sma_backtest
+
 def backtest(data: pd.DataFrame, strategy_func, initial_capital=100000, **kwargs):
     """
     Backtests any strategy function following the template.
     """
-    df = strategy_func(data, **kwargs).copy()
-    df['Position'] = df['Signal'].shift(1).fillna(0)  # trade at next bar
+    df = strategy_func(data, **kwargs)
+    if df is data:  # only copy when the strategy handed back the caller's frame
+        df = df.copy()
+
+    # Positions, returns, equity and drawdown come out of one fused pass
+    close = df['Close'].to_numpy(np.float64, copy=False)
+    signal = df['Signal'].to_numpy(np.float64, copy=False)
+    position, market_return, strategy_return, equity, mdd = backtest_kernel(
+        np.ascontiguousarray(close), np.ascontiguousarray(signal), float(initial_capital)
+    )
+
+    df['Position'] = position
+    df['Market_Return'] = market_return
+    df['Strategy_Return'] = strategy_return
+    df['Equity'] = equity
 
-    # Calculate returns
-    df['Market_Return'] = df['Close'].pct_change()
-    df['Strategy_Return'] = df['Market_Return'] * df['Position']
+    results = {
+        'Final_Capital': equity[-1],
+        'Total_Return_%': (equity[-1] / initial_capital - 1) * 100,
+        'Max_Drawdown_%': mdd,
+        'Equity_Curve': df[['Equity']]
+    }
+    return results, df
+
+def sma_backtest(data: pd.DataFrame, initial_capital=100000, short_window=50, long_window=200):
+    """
+    SMA crossover backtest in one fused pass.
+
+    Equivalent to ``backtest(data, sma_crossover, ...)`` but the moving
+    averages, signal and equity are rolled forward in a single kernel.
+    """
+    prices = np.ascontiguousarray(data['Adj Close'].to_numpy(np.float64))
+    close = np.ascontiguousarray(data['Close'].to_numpy(np.float64))
+    (sma_short, sma_long, signal, position, market_return,
+     strategy_return, equity, mdd, _, _, _) = run_sma_backtest(
+        prices, close, int(short_window), int(long_window), float(initial_capital)
+    )
 
-    # Track equity curve
-    df['Equity'] = (1 + df['Strategy_Return']).cumprod() * initial_capital
+    df = data.assign(
+        SMA_short=sma_short,
+        SMA_long=sma_long,
+        Signal=signal.astype(np.int8),
+        Position=position,
+        Market_Return=market_return,
+        Strategy_Return=strategy_return,
+        Equity=equity,
+    )
 
     results = {
-        'Final_Capital': df['Equity'].iloc[-1],
-        'Total_Return_%': (df['Equity'].iloc[-1] / initial_capital - 1) * 100,
-        'Max_Drawdown_%': max_drawdown(df['Equity']),
+        'Final_Capital': equity[-1],
+        'Total_Return_%': (equity[-1] / initial_capital - 1) * 100,
+        'Max_Drawdown_%': mdd,
         'Equity_Curve': df[['Equity']]
     }
     return results, df
 
 def max_drawdown(equity):
-    roll_max = equity.cummax()
-    drawdown = equity / roll_max - 1
-    return drawdown.min() * 100
+    values = equity.to_numpy() if hasattr(equity, 'to_numpy') else equity
+    return max_drawdown_kernel(np.ascontiguousarray(values, dtype=np.float64))
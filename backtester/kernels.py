@@ -0,0 +1,201 @@
+# backtester/kernels.py
+
+import hashlib
+import warnings
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def log_step(sr):
+    """
+    log(1 + sr) for one bar's return; a loss of 100% or more is ruin (-inf),
+    so equity drops to 0 and stays there instead of turning NaN.
+    """
+    if sr <= -1.0:
+        return -np.inf
+    return np.log1p(sr)
+
+
+@njit(cache=True)
+def max_drawdown_kernel(eq):
+    """
+    Maximum drawdown (as a percentage) of an equity array in one pass.
+
+    NaNs are skipped when tracking the peak, like np.fmax.accumulate.
+    """
+    peak = np.nan
+    mdd = 0.0
+    for i in range(eq.shape[0]):
+        if eq[i] > peak or np.isnan(peak):
+            peak = eq[i]
+        dd = eq[i] / peak - 1.0
+        if dd < mdd:
+            mdd = dd
+    return mdd * 100
+
+
+@njit(cache=True)
+def backtest_kernel(close, signal, capital):
+    """
+    Turn a signal array into positions, returns, equity and max drawdown.
+
+    Parameters
+    ----------
+    close : np.ndarray
+        float64 closing prices
+    signal : np.ndarray
+        float64 strategy signals (1, -1, 0)
+    capital : float
+        Initial capital
+
+    Returns
+    -------
+    tuple
+        (position, market_return, strategy_return, equity, max_drawdown_%)
+    """
+    n = close.shape[0]
+    position = np.zeros(n)
+    market_return = np.full(n, np.nan)
+    strategy_return = np.full(n, np.nan)
+    equity = np.empty(n)
+    if n == 0:
+        return position, market_return, strategy_return, equity, 0.0
+
+    # Compound in log space (sum of log1p) so long curves don't drift or overflow
+    log_growth = 0.0
+    value = capital
+    peak = capital
+    mdd = 0.0
+    equity[0] = capital
+    for i in range(1, n):
+        s = signal[i - 1]  # trade at next bar
+        position[i] = 0.0 if np.isnan(s) else s  # missing signal means flat
+        r = close[i] / close[i - 1] - 1.0
+        market_return[i] = r
+        strategy_return[i] = r * position[i]
+        if not np.isnan(strategy_return[i]):
+            log_growth += log_step(strategy_return[i])
+            value = capital * np.exp(log_growth)
+        equity[i] = value
+        if value > peak:
+            peak = value
+        dd = value / peak - 1.0
+        if dd < mdd:
+            mdd = dd
+    return position, market_return, strategy_return, equity, mdd * 100
+
+
+@njit(cache=True)
+def run_sma_backtest(prices, close, short_w, long_w, capital):
+    """
+    Fused SMA crossover + backtest in a single pass.
+
+    Rolling sums give both moving averages of ``prices`` in O(1) per bar; the
+    crossover signal is traded on ``close`` at the next bar.
+
+    Parameters
+    ----------
+    prices : np.ndarray
+        float64 prices the moving averages are computed on (Adj Close)
+    close : np.ndarray
+        float64 prices returns are computed on (Close)
+    short_w, long_w : int
+        Moving average windows
+    capital : float
+        Initial capital
+
+    Returns
+    -------
+    tuple
+        (sma_short, sma_long, signal, position, market_return,
+        strategy_return, equity, max_drawdown_%, sum_r, sum_r2, n_r)
+        where the last three accumulate the non-NaN strategy returns.
+    """
+    n = close.shape[0]
+    sma_short = np.full(n, np.nan)
+    sma_long = np.full(n, np.nan)
+    signal = np.zeros(n)
+    position = np.zeros(n)
+    market_return = np.full(n, np.nan)
+    strategy_return = np.full(n, np.nan)
+    equity = np.empty(n)
+
+    short_sum = 0.0
+    long_sum = 0.0
+    log_growth = 0.0
+    value = capital
+    peak = capital
+    mdd = 0.0
+    sum_r = 0.0
+    sum_r2 = 0.0
+    n_r = 0
+    for i in range(n):
+        short_sum += prices[i]
+        long_sum += prices[i]
+        if i >= short_w:
+            short_sum -= prices[i - short_w]
+        if i >= long_w:
+            long_sum -= prices[i - long_w]
+        if i >= short_w - 1:
+            sma_short[i] = short_sum / short_w
+        if i >= long_w - 1:
+            sma_long[i] = long_sum / long_w
+        if sma_short[i] > sma_long[i]:
+            signal[i] = 1.0
+        elif sma_short[i] < sma_long[i]:
+            signal[i] = -1.0
+
+        if i > 0:
+            position[i] = signal[i - 1]  # trade at next bar
+            r = close[i] / close[i - 1] - 1.0
+            market_return[i] = r
+            sr = r * position[i]
+            strategy_return[i] = sr
+            if not np.isnan(sr):
+                log_growth += log_step(sr)
+                value = capital * np.exp(log_growth)
+                sum_r += sr
+                sum_r2 += sr * sr
+                n_r += 1
+        equity[i] = value
+        if value > peak:
+            peak = value
+        dd = value / peak - 1.0
+        if dd < mdd:
+            mdd = dd
+
+    return (sma_short, sma_long, signal, position, market_return,
+            strategy_return, equity, mdd * 100, sum_r, sum_r2, n_r)
+
+
+_JIT_KERNELS = (max_drawdown_kernel, backtest_kernel, run_sma_backtest)
+
+def _source_hash():
+    """
+    Hash of this file, embedded in the AOT build so a stale extension is ignored.
+    """
+    with open(__file__, 'rb') as f:
+        return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+
+
+SOURCE_HASH = _source_hash()
+
+# Prefer the ahead-of-time build (python -m backtester._aot) to skip JIT on first call,
+# but only if it was compiled from this exact source
+try:
+    from . import backtester_aot as _aot
+except ImportError:
+    _aot = None
+
+if _aot is not None:
+    if getattr(_aot, 'source_hash', lambda: None)() == SOURCE_HASH:
+        backtest_kernel = _aot.backtest_kernel
+        max_drawdown_kernel = _aot.max_drawdown_kernel
+        run_sma_backtest = _aot.run_sma_backtest
+    else:
+        warnings.warn(
+            "backtester_aot was built from different kernels; using the JIT versions. "
+            "Rebuild with: python -m backtester._aot"
+        )
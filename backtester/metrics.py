@@ -4,6 +4,44 @@ import numpy as np
 import pandas as pd
 
 
+class MetricsContext:
+    """
+    Cleaned equity/return arrays shared across metric calls.
+
+    Build it once per backtest and pass it in place of the Series to
+    calculate_sharpe, calculate_sortino, calculate_calmar and
+    calculate_win_rate so NaN removal and the mean/std reductions are
+    only done once.
+
+    Parameters
+    ----------
+    equity : pd.Series, optional
+        Series of portfolio values over time
+    returns : pd.Series, optional
+        Daily returns (NaNs are dropped)
+    """
+
+    def __init__(self, equity=None, returns=None):
+        self.eq = _to_array(equity)
+        r = _to_array(returns)
+        self.r = r[~np.isnan(r)]
+        n = self.r.shape[0]
+        self.mean = self.r.mean() if n > 0 else np.nan
+        self.std = self.r.std(ddof=1) if n > 1 else np.nan
+
+
+def _to_array(values):
+    if values is None:
+        return np.empty(0)
+    if hasattr(values, 'to_numpy'):
+        return values.to_numpy(np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _context(returns):
+    return returns if isinstance(returns, MetricsContext) else MetricsContext(returns=returns)
+
+
 def calculate_cagr(equity_series):
     """
     Calculate Compound Annual Growth Rate from an equity curve.
@@ -18,14 +56,15 @@ def calculate_cagr(equity_series):
     float
         CAGR as a percentage
     """
-    if len(equity_series) < 2:
+    arr = equity_series.to_numpy() if hasattr(equity_series, 'to_numpy') else np.asarray(equity_series)
+    if arr.shape[0] < 2:
         return 0
     
-    initial_value = equity_series.iloc[0]
-    final_value = equity_series.iloc[-1]
+    initial_value = arr[0]
+    final_value = arr[-1]
     
     # Calculate years (assuming daily data with ~252 trading days per year)
-    n_days = len(equity_series)
+    n_days = arr.shape[0]
     n_years = n_days / 252
     
     if n_years == 0 or initial_value == 0:
@@ -41,7 +80,7 @@ def calculate_sharpe(returns, risk_free_rate=0.02):
     
     Parameters
     ----------
-    returns : pd.Series
+    returns : pd.Series or MetricsContext
         Daily returns
     risk_free_rate : float
         Annual risk-free rate (default 2%)
@@ -51,15 +90,14 @@ def calculate_sharpe(returns, risk_free_rate=0.02):
     float
         Annualized Sharpe ratio
     """
-    # Clean returns (remove NaN and inf)
-    returns_clean = returns.dropna()
+    ctx = _context(returns)
     
-    if len(returns_clean) == 0:
+    if len(ctx.r) == 0:
         return 0
     
     # Annualize metrics (assuming 252 trading days)
-    mean_return = returns_clean.mean() * 252
-    std_return = returns_clean.std() * np.sqrt(252)
+    mean_return = ctx.mean * 252
+    std_return = ctx.std * np.sqrt(252)
     
     if std_return == 0:
         return 0
@@ -82,17 +120,18 @@ def calculate_max_drawdown(equity_series):
     float
         Maximum drawdown as a percentage
     """
-    if len(equity_series) < 2:
+    arr = equity_series.to_numpy() if hasattr(equity_series, 'to_numpy') else np.asarray(equity_series)
+    if arr.shape[0] < 2:
         return 0
     
-    # Calculate running maximum
-    running_max = equity_series.cummax()
+    # Calculate running maximum (fmax skips NaN like pandas cummax)
+    running_max = np.fmax.accumulate(arr)
     
     # Calculate drawdown
-    drawdown = (equity_series - running_max) / running_max
+    drawdown = (arr - running_max) / running_max
     
     # Return max drawdown as percentage
-    return drawdown.min() * 100
+    return np.nanmin(drawdown) * 100
 
 
 def calculate_sortino(returns, risk_free_rate=0.02, target_return=0):
@@ -101,7 +140,7 @@ def calculate_sortino(returns, risk_free_rate=0.02, target_return=0):
     
     Parameters
     ----------
-    returns : pd.Series
+    returns : pd.Series or MetricsContext
         Daily returns
     risk_free_rate : float
         Annual risk-free rate
@@ -113,20 +152,20 @@ def calculate_sortino(returns, risk_free_rate=0.02, target_return=0):
     float
         Annualized Sortino ratio
     """
-    returns_clean = returns.dropna()
+    ctx = _context(returns)
     
-    if len(returns_clean) == 0:
+    if len(ctx.r) == 0:
         return 0
     
     # Calculate downside returns (only negative returns)
-    downside_returns = returns_clean[returns_clean < target_return]
+    downside_returns = ctx.r[ctx.r < target_return]
     
     if len(downside_returns) == 0:
         return np.inf  # No downside risk
     
     # Annualize metrics
-    mean_return = returns_clean.mean() * 252
-    downside_std = downside_returns.std() * np.sqrt(252)
+    mean_return = ctx.mean * 252
+    downside_std = (downside_returns.std(ddof=1) if len(downside_returns) > 1 else np.nan) * np.sqrt(252)
     
     if downside_std == 0:
         return np.inf
@@ -141,7 +180,7 @@ def calculate_calmar(equity_series):
     
     Parameters
     ----------
-    equity_series : pd.Series
+    equity_series : pd.Series or MetricsContext
         Series of portfolio values over time
     
     Returns
@@ -149,6 +188,9 @@ def calculate_calmar(equity_series):
     float
         Calmar ratio
     """
+    if isinstance(equity_series, MetricsContext):
+        equity_series = equity_series.eq
+    
     cagr = calculate_cagr(equity_series)
     max_dd = abs(calculate_max_drawdown(equity_series))
     
@@ -164,7 +206,7 @@ def calculate_win_rate(returns):
     
     Parameters
     ----------
-    returns : pd.Series
+    returns : pd.Series or MetricsContext
         Series of returns
     
     Returns
@@ -172,13 +214,13 @@ def calculate_win_rate(returns):
     float
         Win rate as a percentage
     """
-    returns_clean = returns.dropna()
+    r = _context(returns).r
     
-    if len(returns_clean) == 0:
+    if len(r) == 0:
         return 0
     
-    winning_trades = (returns_clean > 0).sum()
-    total_trades = len(returns_clean[returns_clean != 0])
+    winning_trades = (r > 0).sum()
+    total_trades = np.count_nonzero(r)
     
     if total_trades == 0:
         return 0
@@ -0,0 +1,140 @@
+# backtester/sweep.py
+
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
+from .kernels import log_step
+
+
+@njit(cache=True)
+def _run_one(prices, close, short_w, long_w, capital, risk_free_rate):
+    """
+    SMA crossover backtest reduced to (final_equity, max_drawdown_%, sharpe).
+
+    Same rules as strategies.sma_crossover + backtester.backtest, but only
+    scalars are kept so each parameter pair runs in O(1) extra memory.
+    """
+    n = close.shape[0]
+    short_sum = 0.0
+    long_sum = 0.0
+    prev_signal = 0.0
+    log_growth = 0.0
+    value = capital
+    peak = capital
+    mdd = 0.0
+    sum_r = 0.0
+    sum_r2 = 0.0
+    n_r = 0
+    for i in range(n):
+        short_sum += prices[i]
+        long_sum += prices[i]
+        if i >= short_w:
+            short_sum -= prices[i - short_w]
+        if i >= long_w:
+            long_sum -= prices[i - long_w]
+
+        if i > 0:
+            sr = (close[i] / close[i - 1] - 1.0) * prev_signal  # trade at next bar
+            if not np.isnan(sr):
+                log_growth += log_step(sr)
+                value = capital * np.exp(log_growth)
+                sum_r += sr
+                sum_r2 += sr * sr
+                n_r += 1
+            if value > peak:
+                peak = value
+            dd = value / peak - 1.0
+            if dd < mdd:
+                mdd = dd
+
+        signal = 0.0
+        if i >= short_w - 1 and i >= long_w - 1:
+            sma_s = short_sum / short_w
+            sma_l = long_sum / long_w
+            if sma_s > sma_l:
+                signal = 1.0
+            elif sma_s < sma_l:
+                signal = -1.0
+        prev_signal = signal
+
+    # Annualized Sharpe with the sample std, as in metrics.calculate_sharpe
+    if n_r == 0:
+        sharpe = 0.0
+    elif n_r == 1:
+        sharpe = np.nan
+    else:
+        mean = sum_r / n_r
+        var = (sum_r2 - n_r * mean * mean) / (n_r - 1)
+        std = np.sqrt(max(var, 0.0))
+        sharpe = 0.0 if std == 0 else (mean * 252 - risk_free_rate) / (std * np.sqrt(252))
+    return value, mdd * 100, sharpe
+
+
+@njit(parallel=True, cache=True)
+def sweep(prices, close, shorts, longs, capital, risk_free_rate=0.02):
+    """
+    Run the SMA crossover backtest for many (short, long) window pairs.
+
+    Parameters
+    ----------
+    prices : np.ndarray
+        float64 prices the moving averages are computed on (Adj Close)
+    close : np.ndarray
+        float64 prices returns are computed on (Close)
+    shorts, longs : np.ndarray
+        int64 window pairs, evaluated element-wise in parallel
+    capital : float
+        Initial capital
+    risk_free_rate : float
+        Annual risk-free rate for the Sharpe ratio (default 2%)
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(shorts), 3): final equity, max drawdown %, Sharpe
+    """
+    n = shorts.shape[0]
+    out = np.empty((n, 3))
+    for k in prange(n):
+        out[k, 0], out[k, 1], out[k, 2] = _run_one(
+            prices, close, shorts[k], longs[k], capital, risk_free_rate
+        )
+    return out
+
+
+def sweep_sma(data, short_windows, long_windows, initial_capital=100000, risk_free_rate=0.02):
+    """
+    Grid search SMA crossover windows over a price DataFrame.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Frame with 'Adj Close' and 'Close' columns
+    short_windows, long_windows : iterable of int
+        Candidate windows; only pairs with short < long are evaluated
+    initial_capital : float
+        Initial capital
+    risk_free_rate : float
+        Annual risk-free rate for the Sharpe ratio
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per pair with Short, Long, Final_Capital, Max_Drawdown_%, Sharpe
+    """
+    pairs = [(s, l) for s in short_windows for l in long_windows if s < l]
+    shorts = np.array([p[0] for p in pairs], dtype=np.int64)
+    longs = np.array([p[1] for p in pairs], dtype=np.int64)
+
+    prices = np.ascontiguousarray(data['Adj Close'].to_numpy(np.float64))
+    close = np.ascontiguousarray(data['Close'].to_numpy(np.float64))
+    out = sweep(prices, close, shorts, longs, float(initial_capital), float(risk_free_rate))
+
+    return pd.DataFrame({
+        'Short': shorts,
+        'Long': longs,
+        'Final_Capital': out[:, 0],
+        'Max_Drawdown_%': out[:, 1],
+        'Sharpe': out[:, 2],
+    })
@@ -1,2 +1,2 @@
 #init
-from .data_handler import fetch_data, save_data, load_data
+from .data_handler import fetch_data, fetch_many, save_data, load_data
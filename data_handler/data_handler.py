@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -6,6 +7,27 @@ import yfinance as yf
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Price columns kept as float32; daily prices have far fewer than 7 significant digits
+PRICE_COLS = ["Open", "High", "Low", "Close", "Adj Close"]
+
+# Set DH_DEBUG=1 to print the column/shape diagnostics while fetching
+DEBUG = bool(os.getenv("DH_DEBUG"))
+
+
+def _debug(msg):
+    if DEBUG:
+        print(f"[Debug] {msg}")
+
+
+def _download(tickers, start, end, interval, **kwargs):
+    # yfinance manages its own (curl_cffi) session; repeat requests are served
+    # from the Parquet cache in load_data rather than an HTTP cache
+    # Suppress the FutureWarning by explicitly setting auto_adjust
+    return yf.download(
+        tickers, start=start, end=end, interval=interval,
+        auto_adjust=False, threads=True, progress=False, **kwargs
+    )
+
 
 def fetch_data(ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
     """
@@ -27,31 +49,60 @@ def fetch_data(ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
     pd.DataFrame
         DataFrame with columns: Date, Open, High, Low, Close, Adj Close, Volume.
     """
-    # Suppress the FutureWarning by explicitly setting auto_adjust
-    df = yf.download(ticker, start=start, end=end, interval=interval, auto_adjust=False)
+    df = _download(ticker, start, end, interval)
+    return _prepare(df, ticker)
+
+
+def fetch_many(tickers, start="2015-01-01", end="2024-12-31", interval="1d"):
+    """
+    Fetch several tickers with a single threaded Yahoo Finance request.
+
+    Parameters
+    ----------
+    tickers : list of str
+        Stock tickers (e.g. ["AAPL", "MSFT"]).
+    start, end, interval : str
+        Same as fetch_data.
+
+    Returns
+    -------
+    dict
+        Mapping of ticker to a DataFrame shaped like fetch_data's output.
+    """
+    tickers = list(tickers)
+    df = _download(tickers, start, end, interval, group_by="ticker")
+
+    frames = {}
+    for ticker in tickers:
+        if isinstance(df, pd.DataFrame) and isinstance(df.columns, pd.MultiIndex) \
+                and ticker in df.columns.get_level_values(0):
+            frames[ticker] = _prepare(df[ticker].copy(), ticker)
+        else:
+            print(f"[Error] No valid data returned for ticker: {ticker}")
+            frames[ticker] = pd.DataFrame()
+    return frames
+
 
+def _prepare(df, ticker):
+    """
+    Normalize a raw yfinance frame to the Date/OHLCV schema.
+    """
     # Check if valid data was returned
     if not isinstance(df, pd.DataFrame) or df.empty:
         print(f"[Error] No valid data returned for ticker: {ticker}")
         return pd.DataFrame()
 
     # Debug: Print the actual columns returned
-    print(f"[Debug] Columns returned for {ticker}: {list(df.columns)}")
-    print(f"[Debug] Data shape: {df.shape}")
-    print(f"[Debug] Column index type: {type(df.columns)}")
+    _debug(f"Columns returned for {ticker}: {list(df.columns)}")
+    _debug(f"Data shape: {df.shape}")
+    _debug(f"Column index type: {type(df.columns)}")
 
     # Handle MultiIndex columns (common with single ticker downloads)
     if isinstance(df.columns, pd.MultiIndex):
-        print("[Debug] Detected MultiIndex columns, flattening...")
+        _debug("Detected MultiIndex columns, flattening...")
         # For single ticker, take the first level (the actual column names)
         df.columns = [col[0] for col in df.columns]
-        print(f"[Debug] Flattened columns: {list(df.columns)}")
-
-    # Reset index so Date is a normal column instead of the index
-    df.reset_index(inplace=True)
-
-    # Drop rows with NaN values (market holidays, missing data, etc.)
-    df.dropna(inplace=True)
+        _debug(f"Flattened columns: {list(df.columns)}")
 
     # Handle column name variations - yfinance might return different column names
     # Map common variations to standard names
@@ -65,10 +116,10 @@ def fetch_data(ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
     # Apply column mapping if needed
     df.columns = [column_mapping.get(col, col) for col in df.columns]
     
-    print(f"[Debug] Final columns after processing: {list(df.columns)}")
+    _debug(f"Final columns after processing: {list(df.columns)}")
     
-    # Validate schema (ensure all required columns exist)
-    required_cols = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"]
+    # Validate schema (ensure all required columns exist; Date is still the index)
+    required_cols = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     
     if missing_cols:
@@ -85,30 +136,55 @@ def fetch_data(ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
         if missing_cols:
             raise ValueError(f"Missing required columns in data for {ticker}: {missing_cols}")
 
-    # Ensure proper data types
-    numeric_cols = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-    
-    # Convert Date to datetime if it's not already
-    if 'Date' in df.columns:
-        df['Date'] = pd.to_datetime(df['Date'])
+    # Pull the OHLCV block out once as a typed array and build the result in one go
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)  # keep exchange-local bar times, not UTC
+    dates = index.to_numpy("datetime64[ns]")
+    try:
+        # yfinance already returns numeric dtypes, so this is a single cast
+        values = df[required_cols].to_numpy(np.float64)
+    except (TypeError, ValueError):
+        # Malformed rows: coerce anything non-numeric to NaN
+        values = df[required_cols].apply(pd.to_numeric, errors='coerce').to_numpy(np.float64)
+
+    # Drop rows with NaN values (market holidays, missing data, etc.)
+    mask = ~np.isnan(values).any(axis=1)
+
+    out = {"Date": dates[mask]}
+    for j, col in enumerate(required_cols):
+        # Prices as float32 (see PRICE_COLS), Volume as int64
+        out[col] = values[mask, j].astype(np.int64 if col == "Volume" else np.float32)
+    df = pd.DataFrame(out)
 
-    print(f"[Debug] Final data shape: {df.shape}")
-    print(f"[Debug] Sample of processed data:\n{df.head()}")
+    _debug(f"Final data shape: {df.shape}")
+    _debug(f"Sample of processed data:\n{df.head()}")
 
     return df
 
 
+def _downcast_prices(df):
+    """
+    Store OHLC prices as float32 (Volume stays int64) to halve memory traffic.
+    """
+    for col in PRICE_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def _cache_path(ticker, start, end, interval, ext="parquet"):
+    filename = f"{ticker}_{interval}_{start}_{end}.{ext}"
+    return os.path.join(DATA_DIR, filename)
+
+
 def save_data(df, ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
     """
-    Save DataFrame to CSV inside the /data folder.
+    Save DataFrame to Parquet inside the /data folder.
     """
-    filename = f"{ticker}_{interval}_{start}_{end}.csv"
-    filepath = os.path.join(DATA_DIR, filename)
+    filepath = _cache_path(ticker, start, end, interval)
 
-    df.to_csv(filepath, index=False)
+    df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
     print(f"[Info] Data saved to: {filepath}")
     return filepath
 
@@ -117,20 +193,27 @@ def load_data(ticker, start="2015-01-01", end="2024-12-31", interval="1d"):
     """
     Load data if already cached, otherwise fetch and save it.
 
+    Legacy CSV caches are converted to Parquet the first time they are read.
+
     Returns
     -------
     pd.DataFrame
     """
-    filename = f"{ticker}_{interval}_{start}_{end}.csv"
-    filepath = os.path.join(DATA_DIR, filename)
+    filepath = _cache_path(ticker, start, end, interval)
+    legacy_path = _cache_path(ticker, start, end, interval, ext="csv")
 
     if os.path.exists(filepath):
         print(f"[Info] Loading cached data from: {filepath}")
-        df = pd.read_csv(filepath, parse_dates=["Date"])
+        # Parquet keeps column dtypes, so no date/number parsing is needed
+        return pd.read_parquet(filepath, engine="pyarrow", memory_map=True)
+    elif os.path.exists(legacy_path):
+        print(f"[Info] Migrating cached CSV to Parquet: {legacy_path}")
+        df = _downcast_prices(pd.read_csv(legacy_path, parse_dates=["Date"]))
+        save_data(df, ticker, start, end, interval)
         return df
     else:
         print(f"[Info] Fetching new data for {ticker}")
         df = fetch_data(ticker, start, end, interval)
         if not df.empty:  # Save only if data is valid
             save_data(df, ticker, start, end, interval)
-        return df
\ No newline at end of file
+        return df
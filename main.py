@@ -1,31 +1,36 @@
 import sys
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import from your modules
-from data_handler.data_handler import load_data
+from utils.data_loader import get_data
 from strategies.moving_average import sma_crossover
 from backtester.backtester import backtest, max_drawdown
-from utils.plotter import plot_equity_curve, plot_signals
+from utils.plotter import plot_equity_curve, plot_signals, set_headless
+
+# pyplot keeps global figure state, so plots are rendered one at a time on a
+# single background thread, off the thread doing the backtests
+_PLOT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_PLOT_FUTURES = []
 
 
 def calculate_cagr(equity_series):
     """
     Calculate Compound Annual Growth Rate
     """
-    import pandas as pd
-    
-    if len(equity_series) < 2:
+    n_days = len(equity_series)
+    if n_days < 2:
         return 0
     
-    initial_value = equity_series.iloc[0]
-    final_value = equity_series.iloc[-1]
+    initial_value, final_value = equity_series.values[[0, -1]]
     
     # Calculate years (assuming daily data)
-    n_days = len(equity_series)
     n_years = n_days / 252  # Trading days per year
     
     if n_years == 0 or initial_value == 0:
@@ -40,17 +45,16 @@ def calculate_sharpe(returns, risk_free_rate=0.02):
     Calculate Sharpe Ratio
     Assumes returns are daily returns
     """
-    import numpy as np
+    # Clean returns (remove NaN) on the raw array
+    r = returns.to_numpy(np.float64)
+    r = r[~np.isnan(r)]
     
-    # Clean returns (remove NaN and inf)
-    returns_clean = returns.dropna()
-    
-    if len(returns_clean) == 0:
+    if len(r) == 0:
         return 0
     
-    # Annual Sharpe ratio (assuming 252 trading days)
-    mean_return = returns_clean.mean() * 252
-    std_return = returns_clean.std() * np.sqrt(252)
+    # Annual Sharpe ratio (assuming 252 trading days, sample std as in pandas)
+    mean_return = r.mean() * 252
+    std_return = (r.std(ddof=1) if len(r) > 1 else np.nan) * np.sqrt(252)
     
     if std_return == 0:
         return 0
@@ -59,55 +63,152 @@ def calculate_sharpe(returns, risk_free_rate=0.02):
     return sharpe
 
 
-def run_backtest(ticker, start, end, short_window, long_window, initial_capital):
+def run_backtest_worker(config):
+    """
+    Load data and backtest one configuration; no printing or plotting.
+
+    Returns a results dict of metrics, or None when no data is available, so
+    it can be fanned out across processes. 'df_with_signals' is included only
+    when config["plot"] is set, to keep the frame out of the pickled result.
+    """
     # 1. Load data
-    df = load_data(ticker, start, end, "1d")
+    df = get_data(config["ticker"], config["start"], config["end"], "1d")
 
     if df.empty:
-        print(f"[Error] No data for {ticker}.")
-        return
+        return None
 
     # 2. Run backtest
     results, df_with_signals = backtest(
         df,
         sma_crossover,
-        initial_capital=initial_capital,
-        short_window=short_window,
-        long_window=long_window,
+        initial_capital=config["initial_capital"],
+        short_window=config["short_window"],
+        long_window=config["long_window"],
+        dtype=config["dtype"],
     )
 
-    # 3. Print metrics
-    print("\n=== Backtest Results ===")
-    print(f"Ticker: {ticker}")
-    print(f"Period: {start} -> {end}")  # Fixed: Changed → to ->
-    print(f"Initial Capital: ${initial_capital:,.2f}")
-    print(f"Final Capital: ${results['Final_Capital']:,.2f}")
-    print(f"Total Return: {results['Total_Return_%']:.2f}%")
-    
     # Calculate additional metrics
-    cagr = calculate_cagr(df_with_signals['Equity'])
-    sharpe = calculate_sharpe(df_with_signals['Strategy_Return'])
-    
-    print(f"CAGR: {cagr:.2f}%")
-    print(f"Sharpe Ratio: {sharpe:.2f}")
-    print(f"Max Drawdown: {results['Max_Drawdown_%']:.2f}%")
+    result = {
+        **config,
+        "Final_Capital": results["Final_Capital"],
+        "Total_Return_%": results["Total_Return_%"],
+        "Max_Drawdown_%": results["Max_Drawdown_%"],
+        "CAGR_%": calculate_cagr(df_with_signals["Equity"]),
+        "Sharpe": calculate_sharpe(df_with_signals["Strategy_Return"]),
+    }
+    if config.get("plot"):
+        result["df_with_signals"] = df_with_signals
+    return result
+
+
+def print_results(result):
+    print("\n=== Backtest Results ===")
+    print(f"Ticker: {result['ticker']}")
+    print(f"Period: {result['start']} -> {result['end']}")  # Fixed: Changed → to ->
+    print(f"Initial Capital: ${result['initial_capital']:,.2f}")
+    print(f"Final Capital: ${result['Final_Capital']:,.2f}")
+    print(f"Total Return: {result['Total_Return_%']:.2f}%")
+    print(f"CAGR: {result['CAGR_%']:.2f}%")
+    print(f"Sharpe Ratio: {result['Sharpe']:.2f}")
+    print(f"Max Drawdown: {result['Max_Drawdown_%']:.2f}%")
+
+
+def report(config, result, plot=False):
+    if result is None:
+        print(f"[Error] No data for {config['ticker']}.")
+        return
 
-    # 4. Plots
-    plot_equity_curve(df_with_signals, ticker)
-    plot_signals(df_with_signals, ticker)
+    # 3. Print metrics
+    print_results(result)
+
+    # 4. Plots (written as PNGs on the background plot thread)
+    if plot:
+        df_with_signals = result["df_with_signals"].copy(deep=False)
+        _PLOT_FUTURES.append(_PLOT_EXECUTOR.submit(plot_equity_curve, df_with_signals, result["ticker"]))
+        _PLOT_FUTURES.append(_PLOT_EXECUTOR.submit(plot_signals, df_with_signals, result["ticker"]))
+
+
+def wait_for_plots():
+    """
+    Block until queued plots are written; returns the number that failed.
+    """
+    failed = 0
+    for future in _PLOT_FUTURES:
+        try:
+            future.result()
+        except Exception as e:
+            print(f"[Error] Plot failed: {e}")
+            failed += 1
+    _PLOT_EXECUTOR.shutdown(wait=True)
+    return failed
+
+
+def run_backtest(ticker, start, end, short_window, long_window, initial_capital, dtype="float64", plot=False):
+    config = dict(
+        ticker=ticker, start=start, end=end, short_window=short_window,
+        long_window=long_window, initial_capital=initial_capital, dtype=dtype, plot=plot,
+    )
+    report(config, run_backtest_worker(config), plot)
+
+
+def _init_worker():
+    # Workers never plot; keep matplotlib off any GUI backend
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def run_backtests(configs, plot=False):
+    """
+    Backtest independent configurations in parallel, then report serially.
+    """
+    if not configs:
+        return
+    configs = [{**config, "plot": plot} for config in configs]
+    workers = min(len(configs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+        results = list(ex.map(run_backtest_worker, configs))
+
+    for config, result in zip(configs, results):
+        report(config, result, plot)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Algo Trading Simulator")
     parser.add_argument("--ticker", type=str, default="MSFT", help="Stock ticker")
+    parser.add_argument("--tickers", type=str, default=None,
+                        help="Comma-separated tickers to backtest in parallel (overrides --ticker)")
     parser.add_argument("--start", type=str, default="2015-01-01", help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end", type=str, default="2024-12-31", help="End date (YYYY-MM-DD)")
     parser.add_argument("--short_window", type=int, default=50, help="Short SMA window")
     parser.add_argument("--long_window", type=int, default=200, help="Long SMA window")
     parser.add_argument("--capital", type=float, default=100000, help="Initial capital")
+    parser.add_argument("--dtype", type=str, default="float32", choices=["float32", "float64"],
+                        help="Price/SMA precision for the SMA crossover strategy")
+
+    parser.add_argument("--plot", action="store_true",
+                        help="Save equity/signal plots as PNGs (rendered on a background thread)")
 
     args = parser.parse_args()
 
-    run_backtest(
-        args.ticker, args.start, args.end, args.short_window, args.long_window, args.capital
-    )
\ No newline at end of file
+    if args.plot:
+        set_headless()
+
+    if args.tickers:
+        tickers = [t.strip() for t in args.tickers.split(",") if t.strip()]
+        if not tickers:
+            parser.error("--tickers needs at least one ticker")
+        run_backtests([
+            dict(ticker=t, start=args.start, end=args.end, short_window=args.short_window,
+                 long_window=args.long_window, initial_capital=args.capital, dtype=args.dtype)
+            for t in tickers
+        ], plot=args.plot)
+    else:
+        run_backtest(
+            args.ticker, args.start, args.end, args.short_window, args.long_window, args.capital, args.dtype,
+            plot=args.plot,
+        )
+
+    # Let queued plots finish writing before exiting; fail if any didn't
+    if wait_for_plots():
+        sys.exit(1)
+
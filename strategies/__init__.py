@@ -1 +1 @@
-from .moving_average import sma_crossover
\ No newline at end of file
+from .moving_average import sma_crossover, sma_crossover_sweep
\ No newline at end of file
@@ -0,0 +1,31 @@
+# strategies/_aot.py
+"""
+Ahead-of-time build of the SMA crossover kernel.
+
+Run ``python -m strategies._aot`` once after installing to produce the
+``sma_kernels`` extension next to this file; strategies.moving_average picks
+it up on import so the first backtest doesn't wait on the Numba JIT.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .moving_average import SOURCE_HASH, _sma_crossover_kernel
+
+cc = CC('sma_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# One export per price dtype sma_crossover supports
+cc.export('sma_crossover_f8', 'Tuple((f8[:], f8[:], i1[:]))(f8[:], i8, i8)')(_sma_crossover_kernel.py_func)
+cc.export('sma_crossover_f4', 'Tuple((f4[:], f4[:], i1[:]))(f4[:], i8, i8)')(_sma_crossover_kernel.py_func)
+
+
+# Checked by strategies.moving_average on import so a build of older source isn't used
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -1,24 +1,129 @@
+import hashlib
+import warnings
+
+import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _sma_crossover_kernel(prices, sw, lw):
+    """
+    Short and long SMAs plus the int8 crossover signal in one running-sum pass.
+
+    Kept over a NumPy cumsum difference or np.convolve with a uniform kernel:
+    it is O(N) like the cumsum trick but makes a single pass for both windows,
+    where convolution is O(N*W) and slower for every window the app allows.
+    """
+    n = prices.shape[0]
+    sma_s = np.full(n, np.nan, prices.dtype)
+    sma_l = np.full(n, np.nan, prices.dtype)
+    signal = np.zeros(n, dtype=np.int8)
+    ss = 0.0  # sums stay float64 even for float32 prices
+    ls = 0.0
+    for i in range(n):
+        ss += prices[i]
+        ls += prices[i]
+        if i >= sw:
+            ss -= prices[i - sw]
+        if i >= lw:
+            ls -= prices[i - lw]
+        # Compare the float64 averages; rounding to float32 first creates false ties
+        a = ss / sw if i >= sw - 1 else np.nan
+        b = ls / lw if i >= lw - 1 else np.nan
+        sma_s[i] = a
+        sma_l[i] = b
+        # Branchless sign of the spread; NaN compares false so warm-up bars stay 0
+        signal[i] = np.int8(a > b) - np.int8(a < b)
+    return sma_s, sma_l, signal
+
 
-def sma_crossover(data: pd.DataFrame, short_window=50, long_window=200) -> pd.DataFrame:
+def _source_hash():
+    """
+    Hash of this file, embedded in the AOT build so a stale extension is ignored.
+    """
+    with open(__file__, 'rb') as f:
+        return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+
+
+SOURCE_HASH = _source_hash()
+
+# Prefer the ahead-of-time build (python -m strategies._aot) to skip JIT on first call,
+# but only if it was compiled from this exact source
+try:
+    from . import sma_kernels as _aot
+except ImportError:
+    _aot = None
+
+if _aot is not None and getattr(_aot, 'source_hash', lambda: None)() == SOURCE_HASH:
+    _AOT_KERNELS = {np.dtype(np.float32): _aot.sma_crossover_f4, np.dtype(np.float64): _aot.sma_crossover_f8}
+else:
+    if _aot is not None:
+        warnings.warn(
+            "sma_kernels was built from a different kernel; using the JIT version. "
+            "Rebuild with: python -m strategies._aot"
+        )
+    _AOT_KERNELS = {}
+    # Pay the JIT compile cost at import rather than on the first backtest
+    _sma_crossover_kernel(np.zeros(8), 2, 4)
+    _sma_crossover_kernel(np.zeros(8, dtype=np.float32), 2, 4)
+
+
+def sma_crossover(data: pd.DataFrame, short_window=50, long_window=200, dtype=np.float64) -> pd.DataFrame:
     """
     Moving Average Crossover Strategy
     - Buy signal (1) when short SMA > long SMA
     - Sell signal (-1) when short SMA < long SMA
     - Hold (0) otherwise
 
+    dtype sets the precision of the prices fed to the SMAs and of the SMA
+    columns; np.float32 halves their memory traffic.
+
     Returns:
         DataFrame with 'Signal' column added.
     """
-    df = data.copy()
-
     # Compute moving averages (require full window before producing a value)
-    df['SMA_short'] = df['Adj Close'].rolling(window=short_window).mean()
-    df['SMA_long']  = df['Adj Close'].rolling(window=long_window).mean()
+    prices = np.ascontiguousarray(data['Adj Close'].to_numpy(dtype))
+    kernel = _AOT_KERNELS.get(prices.dtype, _sma_crossover_kernel)
+    sma_s, sma_l, signal = kernel(prices, short_window, long_window)
+
+    # assign builds the new frame once, leaving the caller's frame untouched
+    return data.assign(SMA_short=sma_s, SMA_long=sma_l, Signal=signal)
+
+
+def sma_crossover_sweep(prices, shorts, longs) -> np.ndarray:
+    """
+    SMA crossover signals for many (short, long) window pairs at once.
+
+    One cumulative sum of the prices serves every window; each distinct
+    window's SMA is computed once and shared between pairs.
+
+    Parameters
+    ----------
+    prices : array-like
+        Prices the moving averages are computed on (e.g. Adj Close)
+    shorts, longs : array-like of int
+        Window pairs, matched element-wise
+
+    Returns
+    -------
+    np.ndarray
+        int8 array of shape (len(shorts), len(prices)) with the same
+        1/-1/0 signal as sma_crossover for each pair
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    shorts = np.asarray(shorts, dtype=np.int64)
+    longs = np.asarray(longs, dtype=np.int64)
+    n = prices.shape[0]
 
-    # Initialize signals
-    df['Signal'] = 0
-    df.loc[df['SMA_short'] > df['SMA_long'], 'Signal'] = 1   # Buy
-    df.loc[df['SMA_short'] < df['SMA_long'], 'Signal'] = -1  # Sell
+    cs = np.concatenate(([0.0], np.cumsum(prices)))
+    windows = np.unique(np.concatenate((shorts, longs)))
+    sma = np.full((windows.shape[0], n), np.nan)
+    for k, w in enumerate(windows):
+        if w <= n:
+            sma[k, w - 1:] = (cs[w:] - cs[:-w]) / w
 
-    return df
+    diff = sma[np.searchsorted(windows, shorts)] - sma[np.searchsorted(windows, longs)]
+    np.sign(diff, out=diff)
+    np.nan_to_num(diff, copy=False, nan=0.0)
+    return diff.astype(np.int8)
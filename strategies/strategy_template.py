@@ -6,8 +6,10 @@ def strategy_template(data: pd.DataFrame, **kwargs) -> pd.DataFrame:
     - Take in a DataFrame with 'Open', 'High', 'Low', 'Close', 'Volume'.
     - Return the same DataFrame with a new column 'Signal':
       1 for buy/long, -1 for sell/short, 0 for no trade.
+    - Add new columns to a shallow copy (data.copy(deep=False)) rather than
+      duplicating the input or writing into it.
     """
-    df = data.copy()
+    df = data.copy(deep=False)  # new frame sharing the input columns
     df['Signal'] = 0  # default no trade
     # --- Your logic here ---
     
@@ -1,8 +1,37 @@
 # utils/data_loader.py
+from functools import lru_cache
+
 from data_handler.data_handler import load_data
 
+
+class _NoData(Exception):
+    """Raised for an empty load so lru_cache doesn't memoize it."""
+
+    def __init__(self, df):
+        super().__init__()
+        self.df = df
+
+
+@lru_cache(maxsize=32)
+def _load_cached(ticker, start, end, interval):
+    df = load_data(ticker, start, end, interval)
+    if df.empty:
+        raise _NoData(df)
+    return df
+
+
 def get_data(ticker: str, start="2015-01-01", end="2024-12-31", interval="1d"):
     """
     Wrapper around data_handler.load_data to simplify imports.
+
+    Results are memoized per (ticker, start, end, interval) for the life of
+    the process, on top of load_data's on-disk Parquet cache, so sweeps that
+    reload the same range skip disk and network. Empty results (a failed
+    fetch) are not kept, so the next call retries. A shallow copy is
+    returned; copy-on-write keeps callers from mutating the cached frame.
     """
-    return load_data(ticker, start, end, interval)
+    try:
+        df = _load_cached(ticker, start, end, interval)
+    except _NoData as e:
+        return e.df
+    return df.copy(deep=False)
@@ -1,33 +1,92 @@
 # utils/plotter.py
+import os
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+# Set HEADLESS=1 to render off-screen with Agg and save PNGs instead of showing
+HEADLESS = bool(os.environ.get("HEADLESS"))
+if HEADLESS:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 
+
+def set_headless():
+    """
+    Switch to the Agg backend and save PNGs instead of opening windows.
+
+    Needed before plotting from a background thread, where GUI backends
+    can't run.
+    """
+    global HEADLESS
+    plt.switch_backend("Agg")
+    HEADLESS = True
+
+
+def _decimate(df, n=2000):
+    """
+    Stride-sample a frame to at most ~n rows for line plots, keeping the last row.
+    """
+    step = max(1, -(-len(df) // n))  # ceiling division, so frames up to 2n rows are thinned too
+    if step == 1 or (len(df) - 1) % step == 0:
+        return df.iloc[::step]
+    return pd.concat([df.iloc[::step], df.iloc[[-1]]])
+
+
+def _dates(df):
+    """
+    Date values as an ndarray, whether Date is a column or the index.
+    """
+    if 'Date' in df.columns:
+        return df['Date'].to_numpy()
+    return df.index.to_numpy()
+
+
+def _finish(filename):
+    if HEADLESS:
+        plt.savefig(filename, dpi=100)
+        plt.close()
+    else:
+        plt.show()
+
+
 def plot_equity_curve(df, ticker):
     """
     Plots the strategy equity curve.
     """
+    line = _decimate(df)
+
     plt.figure(figsize=(12, 6))
-    plt.plot(df['Date'], df['Equity'], label="Strategy Equity")
+    plt.plot(_dates(line), line['Equity'].to_numpy(), label="Strategy Equity", rasterized=True)
     plt.xlabel("Date")
     plt.ylabel("Equity")
     plt.title(f"Equity Curve - {ticker}")
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    _finish(f"{ticker}_equity.png")
 
 
 def plot_signals(df, ticker):
     """
     Plot price with buy/sell markers from 'Signal' column.
     """
+    line = _decimate(df)
+
     plt.figure(figsize=(12, 6))
-    plt.plot(df['Date'], df['Adj Close'], label="Price", alpha=0.6)
+    plt.plot(_dates(line), line['Adj Close'].to_numpy(), label="Price", alpha=0.6, rasterized=True)
 
-    buys = df[df['Signal'] == 1]
-    sells = df[df['Signal'] == -1]
+    # Markers use the full arrays so no signal is thinned out
+    signal = df['Signal'].to_numpy()
+    dates = _dates(df)
+    prices = df['Adj Close'].to_numpy()
+    buy_idx = np.flatnonzero(signal == 1)
+    sell_idx = np.flatnonzero(signal == -1)
 
-    plt.scatter(buys['Date'], buys['Adj Close'], marker="^", color="green", label="Buy", alpha=0.8)
-    plt.scatter(sells['Date'], sells['Adj Close'], marker="v", color="red", label="Sell", alpha=0.8)
+    plt.scatter(dates[buy_idx], prices[buy_idx], marker="^", color="green", label="Buy", alpha=0.8, rasterized=True)
+    plt.scatter(dates[sell_idx], prices[sell_idx], marker="v", color="red", label="Sell", alpha=0.8, rasterized=True)
 
     plt.xlabel("Date")
     plt.ylabel("Price")
@@ -35,4 +94,4 @@ def plot_signals(df, ticker):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    _finish(f"{ticker}_signals.png")